@@ -1,42 +1,126 @@
 import os
+import re
+import hashlib
+import json
 import yaml
-import requests
-import googlemaps
-from datetime import datetime, timedelta
+import orjson
+import anyio
+import asyncio
+import httpx
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from datetime import date
 from dateutil.relativedelta import relativedelta
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import google.generativeai as genai
-from typing import List, Dict, Any, Union
-
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Final, Optional, Sequence, Tuple, Union
+
+# Prefer the libyaml-backed loader when it is available
+try:
+    from yaml import CSafeLoader as ConfigLoader
+except ImportError:
+    from yaml import SafeLoader as ConfigLoader
+
+from persistent_cache import PersistentTTLCache
+from semantic_cache import (
+    semantic_cache,
+    configure_semantic_cache,
+    warm_semantic_cache,
+    save_semantic_caches
+)
 from utils import (
+    coalesce,
+    configure_geocode_cache,
     format_datetime,
-    format_address,
+    format_datetimes,
+    format_address_async,
+    format_addresses_bulk_async,
     event_search_URL,
     format_opening_hours,
     format_contact_number
 )
 
-app = FastAPI()
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialised with orjson, which is considerably faster than the standard library.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# Shared async HTTP client for the PredictHQ and Google Places APIs, opened by lifespan().
+# HTTP/2 multiplexes concurrent requests to the same host over one connection.
+http_client: httpx.AsyncClient
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Set up shared resources on start-up and release them on shutdown.
+
+    Args:
+        app (FastAPI): The application.
+    """
+    global http_client
+
+    # Size the thread pool used for the blocking Gemini calls
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+
+    # Load the embedding model before serving, rather than inside the first classification
+    await run_in_threadpool(warm_semantic_cache)
+
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=10.0
+    )
+    async with http_client:
+        yield
+
+    # Persist the semantic caches so they survive restarts
+    save_semantic_caches()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Load configurations from config.yaml
-with open('config.yaml', 'r') as config_file:
-    config = yaml.safe_load(config_file)
+with open('config.yaml', 'rb') as config_file:
+    config = yaml.load(config_file, Loader=ConfigLoader)
 
 # Access configuration variables
-MODEL_NAME = config['model_name']
-PREDICTHQ_EVENT_LIMIT = config['limits']['predicthq_event_limit']
-GOOGLE_PLACES_LIMIT = config['limits']['google_places_limit']
-INCLUDE_TOP_OFFERINGS_PRICES = config['options']['include_top_offerings_prices']
+MODEL_NAME: Final[str] = config['model_name']
+PREDICTHQ_EVENT_LIMIT: Final[int] = config['limits']['predicthq_event_limit']
+GOOGLE_PLACES_LIMIT: Final[int] = config['limits']['google_places_limit']
+THREAD_POOL_SIZE: Final[int] = config['limits']['thread_pool_size']
+SEARCH_CACHE_MAX_AGE: Final[int] = config['options']['search_cache_max_age']
+INCLUDE_TOP_OFFERINGS_PRICES: Final[bool] = config['options']['include_top_offerings_prices']
+SEMANTIC_CACHE_THRESHOLD: Final[float] = config['semantic_cache']['threshold']
+TOP_OFFERINGS_CACHE_PATH: Final[str] = config['top_offerings_cache']['path']
+TOP_OFFERINGS_CACHE_TTL: Final[int] = config['top_offerings_cache']['ttl']
+TOP_OFFERINGS_CACHE_MAX_ENTRIES: Final[int] = config['top_offerings_cache']['max_entries']
+
+# Persist reverse geocoding results across restarts
+configure_geocode_cache(
+    path=config['geocode_cache']['path'],
+    ttl=config['geocode_cache']['ttl'],
+    max_entries=config['geocode_cache']['max_entries']
+)
 
-# Load environment variables
-GOOGLE_PLACES_API_KEY = os.getenv('GOOGLE_PLACES_API_KEY')
-GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-PREDICTHQ_API_TOKEN = os.getenv('PREDICTHQ_API_TOKEN')
-GEOCODING_API_KEY = os.getenv('GEOCODING_API_KEY')
+# Configure the semantic cache used for the query classifiers
+configure_semantic_cache(
+    enabled=config['semantic_cache']['enabled'],
+    model_name=config['semantic_cache']['model_name'],
+    max_entries=config['semantic_cache']['max_entries'],
+    index_dir=config['semantic_cache']['index_dir']
+)
 
-# Initialize Google Maps Client
-gmaps = googlemaps.Client(key=GOOGLE_PLACES_API_KEY)
+# Load environment variables
+GOOGLE_PLACES_API_KEY: Final[Optional[str]] = os.getenv('GOOGLE_PLACES_API_KEY')
+GEMINI_API_KEY: Final[Optional[str]] = os.getenv('GEMINI_API_KEY')
+PREDICTHQ_API_TOKEN: Final[Optional[str]] = os.getenv('PREDICTHQ_API_TOKEN')
+GEOCODING_API_KEY: Final[Optional[str]] = os.getenv('GEOCODING_API_KEY')
 
 # Configure the Gemini client with the loaded credentials
 genai.configure(api_key=GEMINI_API_KEY)
@@ -44,6 +128,32 @@ genai.configure(api_key=GEMINI_API_KEY)
 # Initialize the Gemini model
 model = genai.GenerativeModel(MODEL_NAME)
 
+# Cache of top offerings & prices by place name, kept on disk across restarts
+top_offerings_cache = PersistentTTLCache(
+    TOP_OFFERINGS_CACHE_PATH,
+    'top_offerings',
+    maxsize=TOP_OFFERINGS_CACHE_MAX_ENTRIES,
+    ttl=TOP_OFFERINGS_CACHE_TTL
+)
+
+# Top offerings currently being generated, by place name, so concurrent requests for the same place share a single call
+inflight_top_offerings: Dict[str, 'asyncio.Future[Dict[str, str]]'] = {}
+
+# Searches currently running, by normalised query, so identical concurrent searches share one run
+inflight_searches: Dict[str, 'asyncio.Future[Response]'] = {}
+
+# Google Places API (New) Text Search endpoint
+PLACES_SEARCH_URL = 'https://places.googleapis.com/v1/places:searchText'
+
+# Request only the fields in the response, so no Place Details call is needed
+PLACES_HEADERS = {
+    'X-Goog-Api-Key': GOOGLE_PLACES_API_KEY,
+    'X-Goog-FieldMask': (
+        'places.displayName,places.formattedAddress,places.nationalPhoneNumber,'
+        'places.googleMapsUri,places.regularOpeningHours,places.types'
+    )
+}
+
 # Base URL for the TIH API
 PREDICTHQ_BASE_URL = 'https://api.predicthq.com/v1/events/'
 
@@ -53,30 +163,88 @@ PREDICTHQ_HEADERS = {
     'Accept': 'application/json'
 }
 
-def classify_user_query(query: str) -> str:
+# PredictHQ event categories
+EVENT_CATEGORIES = [
+    'academic', 'community', 'concerts', 'conferences', 'expos', 'festivals',
+    'observances', 'performing-arts', 'public-holidays', 'school-holidays', 'sports'
+]
+
+# Structured output for the combined query classification
+CLASSIFICATION_CONFIG = genai.GenerationConfig(
+    response_mime_type='application/json',
+    response_schema={
+        'type': 'object',
+        'properties': {
+            'type': {'type': 'string', 'enum': ['event', 'location']},
+            'category': {'type': 'string', 'enum': EVENT_CATEGORIES, 'nullable': True}
+        },
+        'required': ['type']
+    }
+)
+
+# Structured output for batched descriptions
+DESCRIPTIONS_CONFIG = genai.GenerationConfig(
+    response_mime_type='application/json',
+    response_schema={'type': 'array', 'items': {'type': 'string'}}
+)
+
+# Matches '<offering>: <price>' pairs in a comma-separated list
+OFFERING_PATTERN = re.compile(r'\s*([^:,]+?)\s*:\s*([^,\s][^,]*?)\s*(?:,|$)')
+
+# PredictHQ query parameters that do not change between requests
+PREDICTHQ_STATIC_PARAMS = {
+    'place.scope': '1880252',  # Geonames ID for Singapore
+    'limit': PREDICTHQ_EVENT_LIMIT,  # Number of results per page
+    'sort': 'start'  # Sort by event start date
+}
+
+class ClassificationError(Exception):
+    """
+    Raised when the Gemini Model's classification cannot be parsed. Raising instead of
+    returning a default keeps one-off bad responses out of the lru and semantic caches.
     """
-    Classify the user's query as 'event' or 'location'.
+
+@lru_cache(maxsize=4096)
+@semantic_cache(threshold=SEMANTIC_CACHE_THRESHOLD)
+def classify_query_and_category(query: str) -> Tuple[str, Optional[str]]:
+    """
+    Classify the user's query as 'event' or 'location' and, for events,
+    the event category, using a single Gemini call.
 
     Args:
         query (str): The user's query string.
 
     Returns:
-        str: The classification of the query, either 'event' or 'location'.
+        Tuple[str, Optional[str]]: The classification, either 'event' or 'location',
+        and the event category (None for locations or if it could not be determined).
+
+    Raises:
+        ClassificationError: If the response is empty, blocked or not the expected JSON.
     """
     prompt = (
-        f"Determine whether the following query is about an event or a location. "
-        f"Respond with only one word: 'event' or 'location'. Query: '{query}'"
+        "Determine whether the following query is about an event or a location. "
+        "If it is about an event, also determine which of the following topics it is about: "
+        f"{', '.join(EVENT_CATEGORIES)}. "
+        "Return JSON with the keys 'type' ('event' or 'location') and 'category' "
+        "(one of the topics, or null if the query is about a location). "
+        f"Query: '{query}'"
     )
-    response = model.generate_content(prompt)
-    classification = response.text.strip().lower()
-    if 'event' in classification:
-        return 'event'
-    elif 'location' in classification:
-        return 'location'
-    else:
-        # Default to 'location' if the response is unclear
-        return 'location'
-
+    response = model.generate_content(prompt, generation_config=CLASSIFICATION_CONFIG)
+    try:
+        # response.text also raises ValueError for blocked or empty candidates
+        result = json.loads(response.text)
+    except ValueError as e:
+        raise ClassificationError(str(e)) from e
+    if not isinstance(result, dict) or result.get('type') not in ('event', 'location'):
+        raise ClassificationError(f'Unexpected classification: {result!r}')
+
+    if result['type'] == 'location':
+        return 'location', None
+    category = result.get('category')
+    return 'event', category if category in EVENT_CATEGORIES else None
+
+@lru_cache(maxsize=4096)
+@semantic_cache(threshold=SEMANTIC_CACHE_THRESHOLD)
 def classify_event(query: str) -> str:
     """
     Classify the event type from the user's query.
@@ -97,6 +265,7 @@ def classify_event(query: str) -> str:
     response = model.generate_content(prompt)
     return response.text
 
+@lru_cache(maxsize=4096)
 def generate_event_description(event_name: str, event_description: str) -> str:
     """
     Formats an event description by removing the phrase 
@@ -119,13 +288,14 @@ def generate_event_description(event_name: str, event_description: str) -> str:
     response = model.generate_content(prompt)
     return response.text
 
-def generate_place_description(name: str, types: List[str]) -> str:
+@lru_cache(maxsize=4096)
+def generate_place_description(name: str, types: Tuple[str, ...]) -> str:
     """
     Generate a description for a place using the Gemini model.
 
     Args:
         name (str): The name of the place.
-        types (List[str]): A list of types/categories of the place.
+        types (Tuple[str, ...]): The types/categories of the place.
 
     Returns:
         str: The generated description.
@@ -134,6 +304,86 @@ def generate_place_description(name: str, types: List[str]) -> str:
     response = model.generate_content(prompt)
     return response.text
 
+def parse_descriptions(response_text: str, count: int) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a batched description response, a JSON array of strings.
+
+    Args:
+        response_text (str): The text of the Gemini response.
+        count (int): The number of descriptions expected.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The descriptions in order, or None if the
+        response is not an array of the expected length.
+    """
+    try:
+        descriptions = json.loads(response_text)
+    except ValueError:
+        return None
+    if not isinstance(descriptions, list) or len(descriptions) != count:
+        return None
+    return tuple(str(description) for description in descriptions)
+
+@lru_cache(maxsize=1024)
+def generate_event_descriptions_batch(items: Tuple[Tuple[str, str], ...]) -> Optional[Tuple[str, ...]]:
+    """
+    Generate descriptions for several events with a single Gemini call.
+    Returns None if the batched response cannot be parsed, so the caller can
+    fall back to one call per event.
+
+    Args:
+        items (Tuple[Tuple[str, str], ...]): The (event name, original description) pairs.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The generated descriptions, in the same order as
+            the items, or None if the response cannot be parsed.
+    """
+    if not items:
+        return ()
+    events = "\n".join(
+        f"{index}) name: {event_name}; description: "
+        f"{event_description.replace('Sourced from predicthq.com - ', '')}"
+        for index, (event_name, event_description) in enumerate(items, start=1)
+    )
+    prompt = (
+        "Provide a 350-400 character description for each of the following events, "
+        "expanding upon the simple description given for each. "
+        "Return a JSON array of the descriptions, in the same order as the events.\n"
+        f"{events}"
+    )
+    response = model.generate_content(prompt, generation_config=DESCRIPTIONS_CONFIG)
+    return parse_descriptions(response.text, len(items))
+
+@lru_cache(maxsize=1024)
+def generate_place_descriptions_batch(
+    items: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Optional[Tuple[str, ...]]:
+    """
+    Generate descriptions for several places with a single Gemini call.
+    Returns None if the batched response cannot be parsed, so the caller can
+    fall back to one call per place.
+
+    Args:
+        items (Tuple[Tuple[str, Tuple[str, ...]], ...]): The (name, types) pairs of the places.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The generated descriptions, in the same order as
+            the items, or None if the response cannot be parsed.
+    """
+    if not items:
+        return ()
+    places = "\n".join(
+        f"{index}) name: {name}; types: {', '.join(types)}"
+        for index, (name, types) in enumerate(items, start=1)
+    )
+    prompt = (
+        "Provide a 350-400 character description for each of the following places. "
+        "Return a JSON array of the descriptions, in the same order as the places.\n"
+        f"{places}"
+    )
+    response = model.generate_content(prompt, generation_config=DESCRIPTIONS_CONFIG)
+    return parse_descriptions(response.text, len(items))
+
 def generate_top_offerings_prices(name: str) -> Dict:
     """
     Generates a list of top offerings and their prices for a given place.
@@ -160,59 +410,305 @@ def generate_top_offerings_prices(name: str) -> Dict:
     # Extract the generated text
     response_text = response.text
 
-    # Parse the response into a nested JSON object
-    offerings_dict = {}
-    offerings_list = response_text.split(',')
-    for offering in offerings_list:
-        if ':' in offering:
-            key, value = offering.split(':', 1)
-            offerings_dict[key.strip()] = value.strip()
-        else:
-            continue
+    # Parse the '<offering>: <price>' pairs into a nested JSON object
+    offerings_dict = dict(OFFERING_PATTERN.findall(response_text))
 
     return offerings_dict
 
 
-def fetch_events_from_predicthq(query: str) -> Union[List[Dict[str, Any]], int]:
+@lru_cache(maxsize=1)
+def event_date_window(today: date) -> Tuple[str, str]:
     """
-    Fetch events from PredictHQ API based on the query.
+    Get the date range to search for events in, from today until a year from now.
+    Cached on the current date, so it is only rebuilt when the day changes.
+
+    Args:
+        today (date): The current date.
+
+    Returns:
+        Tuple[str, str]: The start and end dates in ISO format.
+    """
+    return today.isoformat(), (today + relativedelta(years=1)).isoformat()
+
+async def classify_query(query: str) -> Tuple[str, Optional[str]]:
+    """
+    Classify the user's query without blocking the event loop,
+    defaulting to 'location' if the response is unclear.
 
     Args:
         query (str): The user's query string.
 
     Returns:
-        Union[List[Dict[str, Any]], int]: A list of event data dictionaries or a status code.
+        Tuple[str, Optional[str]]: The classification and the event category, as
+        returned by classify_query_and_category.
+    """
+    try:
+        return await run_in_threadpool(classify_query_and_category, query)
+    except ClassificationError:
+        return 'location', None
+
+async def generate_descriptions(
+    generate_batch: Callable[[Tuple], Optional[Tuple[str, ...]]],
+    generate_one: Callable[..., str],
+    items: Tuple[Tuple, ...]
+) -> Tuple[str, ...]:
+    """
+    Generate descriptions for several items with a single batched Gemini call,
+    falling back to concurrent per-item calls if the batched response cannot be parsed.
+
+    Args:
+        generate_batch (Callable[[Tuple], Optional[Tuple[str, ...]]]): The batched description function.
+        generate_one (Callable[..., str]): The per-item description function, called with each item unpacked.
+        items (Tuple[Tuple, ...]): The items to describe.
+
+    Returns:
+        Tuple[str, ...]: The generated descriptions, in the same order as the items.
+    """
+    descriptions = await run_in_threadpool(generate_batch, items)
+    if descriptions is None:
+        descriptions = tuple(await asyncio.gather(
+            *[run_in_threadpool(generate_one, *item) for item in items]
+        ))
+    return descriptions
+
+async def batch_item(batch: Awaitable[Sequence[str]], index: int) -> str:
+    """
+    Await a batched result and pick out a single item from it.
+
+    Args:
+        batch (Awaitable[Sequence[str]]): The batched result, shared between callers.
+        index (int): The position of the item in the batch.
+
+    Returns:
+        str: The item at the given position.
+    """
+    return (await batch)[index]
+
+async def process_event(event: Dict[str, Any], description: Awaitable[str]) -> Dict[str, Any]:
+    """
+    Build the response record for a single PredictHQ event.
+    The address lookup and description generation run concurrently.
+
+    Args:
+        event (Dict[str, Any]): A single event from the PredictHQ results.
+        description (Awaitable[str]): The pending generated description of the event.
+
+    Returns:
+        Dict[str, Any]: The formatted event data.
+    """
+    location, description = await asyncio.gather(
+        format_address_async(event['location'], GEOCODING_API_KEY, http_client),
+        description
+    )
+    return build_event_record(
+        event, location, description, format_datetime(event['start']), format_datetime(event['end'])
+    )
+
+def build_event_record(
+    event: Dict[str, Any], location: str, description: str, start: str, end: str
+) -> Dict[str, Any]:
+    """
+    Build the response record for a single PredictHQ event.
+
+    Args:
+        event (Dict[str, Any]): A single event from the PredictHQ results.
+        location (str): The formatted address of the event.
+        description (str): The generated description of the event.
+        start (str): The formatted start date and time of the event.
+        end (str): The formatted end date and time of the event.
+
+    Returns:
+        Dict[str, Any]: The formatted event data.
+    """
+    return {
+        "Title": event['title'],
+        "Start Date & Time": start,
+        "End Date & Time": end,
+        "Location": location,
+        "Description": description,
+        "Citation": event_search_URL(event['title']),
+    }
+
+async def get_top_offerings_prices(name: Optional[str]) -> Dict[str, str]:
+    """
+    Get the top offerings and prices for a place from the cache,
+    generating them only on a miss. Concurrent misses for the same
+    place wait for a single generation instead of each calling the model.
+
+    Args:
+        name (Optional[str]): The name of the place, or None if the result has no name.
+
+    Returns:
+        Dict[str, str]: The offerings as keys and prices as values, empty if the place has no name.
     """
-    event_category = classify_event(query)
+    # Without a name there is nothing to search for or cache by
+    if not name:
+        return {}
+
+    key = name.lower().strip()
+    offerings = await run_in_threadpool(top_offerings_cache.get, key)
+    if offerings is not None:
+        return offerings
+
+    return await coalesce(inflight_top_offerings, key, lambda: generate_and_cache_top_offerings(key, name))
+
+async def generate_and_cache_top_offerings(key: str, name: str) -> Dict[str, str]:
+    """
+    Generate the top offerings and prices for a place and cache them.
+
+    Args:
+        key (str): The cache key of the place.
+        name (str): The name of the place.
+
+    Returns:
+        Dict[str, str]: The offerings as keys and prices as values.
+    """
+    # Another request may have generated them since the cache was checked
+    offerings = await run_in_threadpool(top_offerings_cache.get, key)
+    if offerings is not None:
+        return offerings
+
+    offerings = await run_in_threadpool(generate_top_offerings_prices, name)
+    # Do not keep unparseable responses around for the whole TTL
+    if offerings:
+        await run_in_threadpool(top_offerings_cache.set, key, offerings)
+    return offerings
+
+
+async def search_predicthq(
+    query: str, event_category: Optional[str] = None
+) -> Union[List[Dict[str, Any]], int]:
+    """
+    Search the PredictHQ API for upcoming events matching the query.
+
+    Args:
+        query (str): The user's query string.
+        event_category (Optional[str]): The event category, if already known.
+            Classified from the query when not given.
+
+    Returns:
+        Union[List[Dict[str, Any]], int]: The raw PredictHQ events or a status code.
+    """
+    if event_category is None:
+        event_category = await run_in_threadpool(classify_event, query)
+    active_gte, active_lte = event_date_window(date.today())
     params = {
-        'category': f'{event_category}',
-        'place.scope': '1880252',  # Geonames ID for Singapore
-        'active.gte': datetime.now().strftime('%Y-%m-%d'),
-        'active.lte': (datetime.now() + relativedelta(years=1)).strftime('%Y-%m-%d'),
-        'limit': PREDICTHQ_EVENT_LIMIT,  # Number of results per page
-        'sort': 'start'  # Sort by event start date
+        'category': event_category,
+        'active.gte': active_gte,
+        'active.lte': active_lte,
+        **PREDICTHQ_STATIC_PARAMS
     }
-    response = requests.get(PREDICTHQ_BASE_URL, headers=PREDICTHQ_HEADERS, params=params)
+    response = await http_client.get(PREDICTHQ_BASE_URL, headers=PREDICTHQ_HEADERS, params=params)
 
     # Check if the request was successful
     if response.status_code == 200:
-        events = response.json()
-        events_data = []
-        for event in events['results']:
-            data = {
-                "Title": event['title'],
-                "Start Date & Time": format_datetime(event['start']),
-                "End Date & Time": format_datetime(event['end']),
-                "Location": format_address(event['location'], GEOCODING_API_KEY),
-                "Description": generate_event_description(event['title'], event.get('description', 'No description')),
-                "Citation": event_search_URL(event['title']),
-            }
-            events_data.append(data)
-        return events_data
+        return response.json()['results']
     else:
         return response.status_code
 
-def fetch_locations_from_gplaces(query: str) -> Union[List[Dict[str, Any]], int]:
+async def fetch_events_from_predicthq(
+    query: str, event_category: Optional[str] = None
+) -> Union[List[Dict[str, Any]], int]:
+    """
+    Fetch events from PredictHQ API based on the query.
+
+    Args:
+        query (str): The user's query string.
+        event_category (Optional[str]): The event category, if already known.
+            Classified from the query when not given.
+
+    Returns:
+        Union[List[Dict[str, Any]], int]: A list of event data dictionaries or a status code.
+    """
+    events = await search_predicthq(query, event_category)
+    if isinstance(events, int):
+        return events
+
+    # Geocode all event locations in one bulk lookup, concurrently with
+    # describing all events in one Gemini call
+    items = tuple(
+        (event['title'], event.get('description', 'No description')) for event in events
+    )
+    locations, descriptions = await asyncio.gather(
+        format_addresses_bulk_async(
+            [event['location'] for event in events], GEOCODING_API_KEY, http_client
+        ),
+        generate_descriptions(generate_event_descriptions_batch, generate_event_description, items)
+    )
+    # Format all start and end times in one batch
+    starts = format_datetimes([event['start'] for event in events])
+    ends = format_datetimes([event['end'] for event in events])
+    return [
+        build_event_record(event, location, description, start, end)
+        for event, location, description, start, end in zip(events, locations, descriptions, starts, ends)
+    ]
+
+async def process_place(place: Dict[str, Any], description: Awaitable[str]) -> Dict[str, Any]:
+    """
+    Build the response record for a single place.
+
+    Args:
+        place (Dict[str, Any]): A single result from the Google Places Text Search API,
+            with the fields in PLACES_HEADERS.
+        description (Awaitable[str]): The pending generated description of the place.
+
+    Returns:
+        Dict[str, Any]: The formatted location data.
+    """
+    name = get_place_name(place)
+
+    # Generate the description and top offerings concurrently
+    tasks = [description]
+    if INCLUDE_TOP_OFFERINGS_PRICES:
+        tasks.append(get_top_offerings_prices(name))
+    description, *top_offerings = await asyncio.gather(*tasks)
+
+    # Extract required fields
+    data = {
+        "Name": name,
+        "Address": place.get('formattedAddress'),
+        "Opening Hours": format_opening_hours(place.get('regularOpeningHours', {})),
+        "Description": description,
+        "Contact Number": format_contact_number(place.get('nationalPhoneNumber')),
+        "Citation": [place.get('googleMapsUri')]
+    }
+
+    if INCLUDE_TOP_OFFERINGS_PRICES:
+        data["Top Offerings & Prices"] = top_offerings[0]
+
+    return data
+
+def get_place_name(place: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the display name of a Google Places Text Search result.
+
+    Args:
+        place (Dict[str, Any]): A single result from the Google Places Text Search API.
+
+    Returns:
+        Optional[str]: The name of the place.
+    """
+    return place.get('displayName', {}).get('text')
+
+async def search_gplaces(query: str) -> List[Dict[str, Any]]:
+    """
+    Search the Google Places Text Search API for places matching the query.
+
+    Args:
+        query (str): The user's query string.
+
+    Returns:
+        List[Dict[str, Any]]: At most GOOGLE_PLACES_LIMIT raw Text Search results.
+    """
+    response = await http_client.post(
+        PLACES_SEARCH_URL,
+        headers=PLACES_HEADERS,
+        json={'textQuery': query, 'pageSize': GOOGLE_PLACES_LIMIT}
+    )
+    response.raise_for_status()
+    return response.json().get('places', [])[:GOOGLE_PLACES_LIMIT]
+
+async def fetch_locations_from_gplaces(query: str) -> Union[List[Dict[str, Any]], int]:
     """
     Fetch locations from Google Places Text Search API
 
@@ -222,66 +718,171 @@ def fetch_locations_from_gplaces(query: str) -> Union[List[Dict[str, Any]], int]
     Returns:
         Union[List[Dict[str, Any]], int]: A list of location data dictionaries or a status code.
     """
-    places_result = gmaps.places(query=query)
-    places = places_result.get('results', [])
+    places = await search_gplaces(query)
 
     if not places:
-        return JSONResponse(content={"message": "No results found."}, status_code=404)
-
-    # Process each place
-    response_data = []
-    for place in places[:GOOGLE_PLACES_LIMIT]:
-        place_id = place['place_id']
-        place_details = gmaps.place(place_id=place_id)['result']
-
-        # Extract required fields and generate description using Gemini Model
-        name = place_details.get('name')
-        address = place_details.get('formatted_address')
-        opening_hours = format_opening_hours(place_details.get('opening_hours', {}))
-        contact_number = format_contact_number(place_details.get('formatted_phone_number'))
-        citation = [place_details.get('url')]
-        description = generate_place_description(
-            name, place_details.get('types', [])
-        )
-        data = {
-            "Name": name,
-            "Address": address,
-            "Opening Hours": opening_hours,
-            "Description": description,
-            "Contact Number": contact_number,
-            "Citation": citation
-        }
-
-        if INCLUDE_TOP_OFFERINGS_PRICES:
-            top_offerings = generate_top_offerings_prices(name)
-            data["Top Offerings & Prices"] = top_offerings
-
-        response_data.append(data)
-    return response_data
+        return ORJSONResponse(content={"message": "No results found."}, status_code=404)
+
+    # Describe all places with one Gemini call while the places are processed concurrently
+    items = tuple((get_place_name(place), tuple(sorted(place.get('types', [])))) for place in places)
+    descriptions = asyncio.ensure_future(
+        generate_descriptions(generate_place_descriptions_batch, generate_place_description, items)
+    )
+    response_data = await asyncio.gather(
+        *[process_place(place, batch_item(descriptions, index)) for index, place in enumerate(places)]
+    )
+    return list(response_data)
+
+async def stream_records(records: List[Awaitable[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """
+    Yield each record as a line of JSON as soon as it is ready.
+    The response headers are already sent by the time a record fails, so a
+    failed record is reported as a {"detail": ...} line and the stream carries on.
+
+    Args:
+        records (List[Awaitable[Dict[str, Any]]]): The pending records.
+
+    Yields:
+        bytes: A JSON-encoded record or error followed by a newline.
+    """
+    tasks = [asyncio.ensure_future(record) for record in records]
+    try:
+        for record in asyncio.as_completed(tasks):
+            try:
+                yield orjson.dumps(await record) + b"\n"
+            except Exception as e:
+                yield orjson.dumps({"detail": str(e)}) + b"\n"
+    finally:
+        # Stop the remaining records if the client disconnects mid-stream
+        for task in tasks:
+            task.cancel()
+
+
+def search_etag(query: str, today: date) -> str:
+    """
+    Build the ETag of a search. Results are treated as unchanged for the
+    same query on the same day.
+
+    Args:
+        query (str): The normalised query string.
+        today (date): The current date.
+
+    Returns:
+        str: The quoted ETag value.
+    """
+    digest = hashlib.blake2b((query + today.isoformat()).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def parse_if_none_match(header: str) -> List[str]:
+    """
+    Split an If-None-Match header into its entity tags.
+
+    Args:
+        header (str): The If-None-Match header value.
+
+    Returns:
+        List[str]: The entity tags, with any weak validator prefix removed.
+    """
+    return [tag.strip().removeprefix('W/') for tag in header.split(',') if tag.strip()]
+
+
+async def run_search(q: str, cache_headers: Dict[str, str]) -> Response:
+    """
+    Classify the query and search for matching events or places.
+
+    Args:
+        q (str): The user's query string.
+        cache_headers (Dict[str, str]): The headers to add to successful results.
+
+    Returns:
+        Response: The search results in JSON format.
+    """
+    try:
+        classification, event_category = await classify_query(q)
+        if classification == 'event':
+            # Use PredictHQ Events API
+            events_data = await fetch_events_from_predicthq(q, event_category)
+            if not events_data:
+                return ORJSONResponse(content={"message": "No upcoming events found."}, status_code=404)
+            if isinstance(events_data, int):
+                return ORJSONResponse(content=events_data)
+            return ORJSONResponse(content=events_data, headers=cache_headers)
+        else:
+            # Use Google Places Text Search API
+            response_data = await fetch_locations_from_gplaces(q)
+            if isinstance(response_data, Response):
+                return response_data
+            return ORJSONResponse(content=response_data, headers=cache_headers)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/search")
-def search(q: str) -> JSONResponse:
+async def search(q: str, request: Request) -> Response:
     """
     Search for events or places based on the user's query.
+    Successful results are marked cacheable for SEARCH_CACHE_MAX_AGE seconds,
+    and requests whose If-None-Match matches the ETag are answered with a 304
+    without doing any work. Identical searches that arrive while one is
+    already running wait for and share its response.
+
+    Args:
+        q (str): The query parameter from the GET request.
+        request (Request): The incoming request.
+
+    Returns:
+        Response: The search results in JSON format, or a 304 Not Modified response.
+    """
+    key = q.strip().lower()
+    etag = search_etag(key, date.today())
+    cache_headers = {
+        'Cache-Control': f'public, max-age={SEARCH_CACHE_MAX_AGE}',
+        'ETag': etag
+    }
+    if etag in parse_if_none_match(request.headers.get('if-none-match', '')):
+        return Response(status_code=304, headers=cache_headers)
+
+    return await coalesce(inflight_searches, key, lambda: run_search(q, cache_headers))
+
+
+@app.get("/search/stream")
+async def search_stream(q: str) -> Response:
+    """
+    Search for events or places based on the user's query, streaming each
+    result as newline-delimited JSON as soon as it is ready.
 
     Args:
         q (str): The query parameter from the GET request.
 
     Returns:
-        JSONResponse: The search results in JSON format.
+        Response: A streaming NDJSON response, or a JSON response if nothing was found.
     """
     try:
-        classification = classify_user_query(q)
+        classification, event_category = await classify_query(q)
         if classification == 'event':
             # Use PredictHQ Events API
-            events_data = fetch_events_from_predicthq(q)
-            if not events_data:
-                return JSONResponse(content={"message": "No upcoming events found."}, status_code=404)
-            return JSONResponse(content=events_data)
+            events = await search_predicthq(q, event_category)
+            if isinstance(events, int):
+                return ORJSONResponse(content=events)
+            if not events:
+                return ORJSONResponse(content={"message": "No upcoming events found."}, status_code=404)
+            records = [
+                process_event(event, run_in_threadpool(
+                    generate_event_description, event['title'], event.get('description', 'No description')
+                ))
+                for event in events
+            ]
         else:
             # Use Google Places Text Search API
-            response_data = fetch_locations_from_gplaces(q)
-            return JSONResponse(content=response_data)
+            places = await search_gplaces(q)
+            if not places:
+                return ORJSONResponse(content={"message": "No results found."}, status_code=404)
+            records = [
+                process_place(place, run_in_threadpool(
+                    generate_place_description, get_place_name(place), tuple(sorted(place.get('types', [])))
+                ))
+                for place in places
+            ]
+        return StreamingResponse(stream_records(records), media_type="application/x-ndjson")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
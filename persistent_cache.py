@@ -0,0 +1,103 @@
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Optional
+
+from cachetools import TTLCache
+
+
+class PersistentTTLCache:
+    """
+    A TTL cache held in memory and backed by a SQLite table, so entries survive restarts.
+    Values must be JSON-serialisable.
+    """
+
+    # Seconds between sweeps of expired rows from the SQLite table
+    PRUNE_INTERVAL = 3600
+
+    def __init__(self, path: str, table: str, maxsize: int, ttl: float):
+        """
+        Args:
+            path (str): The SQLite database file.
+            table (str): The table to store the entries in.
+            maxsize (int): The maximum number of entries kept in memory.
+            ttl (float): The number of seconds an entry stays valid.
+        """
+        self.table = table
+        self.ttl = ttl
+        # Entries are stored with their expiry time, so entries restored
+        # from disk do not outlive their original TTL
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # Drop entries that expired while the application was not running
+            self._prune(time.time())
+
+    def _prune(self, now: float) -> None:
+        """
+        Delete expired rows from the table, so the file does not grow without bound.
+        Must be called with the lock held.
+
+        Args:
+            now (float): The current time.
+        """
+        with self.connection:
+            self.connection.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,))
+        self.next_prune = now + self.PRUNE_INTERVAL
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a key in memory, then on disk.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is missing or expired.
+        """
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is None:
+                row = self.connection.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = (json.loads(row[0]), row[1])
+                self.memory[key] = entry
+
+            value, expires_at = entry
+            if expires_at <= now:
+                self.memory.pop(key, None)
+                with self.connection:
+                    self.connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in memory and on disk.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The JSON-serialisable value.
+        """
+        now = time.time()
+        expires_at = now + self.ttl
+        with self.lock:
+            self.memory[key] = (value, expires_at)
+            with self.connection:
+                self.connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), expires_at)
+                )
+            # Periodically sweep rows that expired without being looked up again
+            if now >= self.next_prune:
+                self._prune(now)
@@ -0,0 +1,234 @@
+import os
+import json
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# faiss and sentence-transformers (and so torch) are imported on first use,
+# so they are only needed when the semantic cache is enabled
+if TYPE_CHECKING:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+
+# Module-level settings, overridden by configure_semantic_cache() at application start-up
+_settings: Dict[str, Any] = {
+    'enabled': True,
+    'model_name': 'sentence-transformers/all-MiniLM-L6-v2',
+    'max_entries': 2048,
+    'index_dir': 'semantic_cache',
+}
+
+logger = logging.getLogger(__name__)
+
+_encoder: Optional['SentenceTransformer'] = None
+_encoder_lock = threading.Lock()
+
+# Every cache created by the decorator, so they can be persisted together
+_caches: List['SemanticCache'] = []
+
+
+def configure_semantic_cache(enabled: bool, model_name: str, max_entries: int, index_dir: str) -> None:
+    """
+    Set the semantic cache options. Must be called before the first cached call.
+
+    Args:
+        enabled (bool): Whether cached functions should consult the cache at all.
+        model_name (str): The sentence-transformers model used to embed queries.
+        max_entries (int): The maximum number of entries kept per cached function.
+        index_dir (str): The directory the FAISS indexes are persisted to.
+    """
+    _settings.update(
+        enabled=enabled,
+        model_name=model_name,
+        max_entries=max_entries,
+        index_dir=index_dir,
+    )
+
+
+def _get_encoder() -> 'SentenceTransformer':
+    """
+    Lazily load the sentence embedding model on first use.
+
+    Returns:
+        SentenceTransformer: The shared embedding model.
+    """
+    global _encoder
+    with _encoder_lock:
+        if _encoder is None:
+            from sentence_transformers import SentenceTransformer
+            _encoder = SentenceTransformer(_settings['model_name'])
+        return _encoder
+
+
+def warm_semantic_cache() -> None:
+    """
+    Load the embedding model ahead of the first request, so no request waits on the
+    model download. If the model cannot be loaded, the cache is disabled and cached
+    functions call through to the model directly.
+    """
+    if not _settings['enabled']:
+        return
+    try:
+        _get_encoder()
+    except Exception:
+        logger.exception("Could not load the semantic cache encoder, disabling the semantic cache")
+        _settings['enabled'] = False
+
+
+def _embed(text: str) -> np.ndarray:
+    """
+    Embed a string into a normalised vector, so inner product equals cosine similarity.
+
+    Args:
+        text (str): The text to embed.
+
+    Returns:
+        np.ndarray: A (1, dim) float32 array.
+    """
+    embedding = _get_encoder().encode([text], normalize_embeddings=True)
+    return np.asarray(embedding, dtype='float32')
+
+
+class SemanticCache:
+    """
+    An in-memory FAISS index of (embedding, response) pairs with LRU eviction.
+    """
+
+    def __init__(self, name: str, threshold: float):
+        self.name = name
+        self.threshold = threshold
+        self.index: Optional['faiss.Index'] = None
+        # Maps FAISS ids to cached responses, ordered from least to most recently used
+        self.entries: 'OrderedDict[int, Any]' = OrderedDict()
+        self.next_id = 0
+        self.lock = threading.Lock()
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(_settings['index_dir'], f'{self.name}.faiss')
+
+    @property
+    def _entries_path(self) -> str:
+        return os.path.join(_settings['index_dir'], f'{self.name}.json')
+
+    def _ensure_index(self, dim: int) -> None:
+        """
+        Create the index, restoring it from disk if a previous run persisted one.
+        Must be called with the lock held.
+        """
+        if self.index is not None:
+            return
+        import faiss
+        if os.path.exists(self._index_path) and os.path.exists(self._entries_path):
+            self.index = faiss.read_index(self._index_path)
+            with open(self._entries_path, 'r') as entries_file:
+                saved = json.load(entries_file)
+            self.entries = OrderedDict((int(key), value) for key, value in saved['entries'])
+            self.next_id = saved['next_id']
+        else:
+            self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+
+    def lookup(self, embedding: np.ndarray) -> Optional[Any]:
+        """
+        Return the cached response of the nearest neighbour if it is similar enough.
+
+        Args:
+            embedding (np.ndarray): The normalised query embedding.
+
+        Returns:
+            Optional[Any]: The cached response, or None on a miss.
+        """
+        with self.lock:
+            self._ensure_index(embedding.shape[1])
+            if self.index.ntotal == 0:
+                return None
+            scores, ids = self.index.search(embedding, 1)
+            entry_id = int(ids[0][0])
+            if entry_id == -1 or scores[0][0] < self.threshold:
+                return None
+            self.entries.move_to_end(entry_id)
+            return self.entries[entry_id]
+
+    def insert(self, embedding: np.ndarray, response: Any) -> None:
+        """
+        Add a response to the cache, evicting the least recently used entry when full.
+
+        Args:
+            embedding (np.ndarray): The normalised query embedding.
+            response (Any): The JSON-serialisable response to cache.
+        """
+        with self.lock:
+            self._ensure_index(embedding.shape[1])
+            entry_id = self.next_id
+            self.next_id += 1
+            self.index.add_with_ids(embedding, np.array([entry_id], dtype='int64'))
+            self.entries[entry_id] = response
+            while len(self.entries) > _settings['max_entries']:
+                evicted_id, _ = self.entries.popitem(last=False)
+                self.index.remove_ids(np.array([evicted_id], dtype='int64'))
+
+    def save(self) -> None:
+        """
+        Persist the index and its responses to the configured directory.
+        """
+        with self.lock:
+            if self.index is None:
+                return
+            import faiss
+            os.makedirs(_settings['index_dir'], exist_ok=True)
+            faiss.write_index(self.index, self._index_path)
+            with open(self._entries_path, 'w') as entries_file:
+                json.dump({'next_id': self.next_id, 'entries': list(self.entries.items())}, entries_file)
+
+
+def semantic_cache(threshold: float = 0.92) -> Callable:
+    """
+    Cache a single-argument text function by the meaning of its input,
+    so paraphrased inputs reuse an earlier response instead of calling the model.
+
+    Args:
+        threshold (float): The minimum cosine similarity for a cache hit.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        cache = SemanticCache(func.__name__, threshold)
+        _caches.append(cache)
+
+        @wraps(func)
+        def wrapper(query: str) -> Any:
+            if not _settings['enabled']:
+                return func(query)
+
+            # The cache is an optimisation, so any embedding or index error falls back to the function
+            try:
+                embedding = _embed(query)
+                cached = cache.lookup(embedding)
+            except Exception:
+                logger.exception("Semantic cache lookup failed for %s", func.__name__)
+                return func(query)
+            if cached is not None:
+                return cached
+
+            response = func(query)
+            try:
+                cache.insert(embedding, response)
+            except Exception:
+                logger.exception("Semantic cache insert failed for %s", func.__name__)
+            return response
+
+        return wrapper
+    return decorator
+
+
+def save_semantic_caches() -> None:
+    """
+    Persist every semantic cache to disk.
+    """
+    for cache in _caches:
+        cache.save()
@@ -1,7 +1,75 @@
+import re
+import anyio
+import asyncio
+import orjson
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Awaitable, Callable, TypeVar
+from urllib.parse import quote_plus
 
+from persistent_cache import PersistentTTLCache
+
+_T = TypeVar('_T')
+
+# Retries for rate-limited and transient server errors, shared by the sync and async lookups
+_GEOCODE_RETRIES = 2
+_GEOCODE_BACKOFF = 0.3
+_GEOCODE_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Shared session so repeated requests reuse keep-alive connections,
+# retrying rate-limited and transient server errors with backoff
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=_GEOCODE_RETRIES,
+        backoff_factor=_GEOCODE_BACKOFF,
+        status_forcelist=_GEOCODE_RETRY_STATUSES,
+        raise_on_status=False
+    )
+))
+_SESSION.headers.update({'Connection': 'keep-alive'})
+
+# URL templates for reverse geocoding and event search links
+_GEOCODE_URL = 'https://maps.googleapis.com/maps/api/geocode/json?latlng={lat},{lng}&key={key}'
+_SEARCH_URL = 'https://www.google.com/search?q={q}'
+
+# (connect, read) timeouts in seconds, for the requests and httpx clients
+_GEOCODE_TIMEOUT = (3.05, 5)
+_GEOCODE_ASYNC_TIMEOUT = httpx.Timeout(_GEOCODE_TIMEOUT[1], connect=_GEOCODE_TIMEOUT[0])
+
+# Reverse geocoding results by rounded coordinates, kept for 48 hours. Held in an
+# in-memory database until configure_geocode_cache() points it at a file
+_GEOCODE_CACHE_TTL = 48 * 3600
+_GEOCODE_CACHE = PersistentTTLCache(':memory:', 'geocode', maxsize=4096, ttl=_GEOCODE_CACHE_TTL)
+
+# Async lookups currently running, by cache key, so concurrent lookups of the same venue share one request
+_GEOCODE_INFLIGHT: Dict[str, 'asyncio.Future[str]'] = {}
+
+# A Singaporean number, 'XXXX XXXX' or 'XXXXXXXX'
+_PHONE_PATTERN = re.compile(r'^\s*(\d{4})\s*(\d{4})\s*$')
+
+# Offset from UTC to Singapore time
+_GMT8 = timedelta(hours=8)
+
+# Month abbreviations, indexed by month number - 1
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Batches with at least this many distinct timestamps are formatted with NumPy,
+# below it the per-call overhead of NumPy outweighs the scalar path. The app formats at most
+# 2 * predicthq_event_limit timestamps per search, so this is only reached with a raised limit
+_VECTORIZE_MIN_BATCH = 32
+
+# Day abbreviations, indexed by the day numbers used by Google Places (0 is Sunday)
+_DAYS = ('Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat')
+
+@lru_cache(maxsize=1024)
 def format_datetime(original_datetime_str: str) -> str:
     """
     Format a datetime string from ISO format to a readable format.
@@ -12,20 +80,255 @@ def format_datetime(original_datetime_str: str) -> str:
     Returns:
         str: The formatted datetime string.
     """
-    # Parse the original string into a datetime object
-    dt_obj = datetime.strptime(original_datetime_str, '%Y-%m-%dT%H:%M:%SZ')
+    # Slice the fields out of the fixed 'YYYY-MM-DDTHH:MM:SSZ' layout
+    year = int(original_datetime_str[0:4])
+    month = int(original_datetime_str[5:7])
+    day = int(original_datetime_str[8:10])
+    minute = int(original_datetime_str[14:16])
 
     # Add 8 hours to convert to GMT +8
-    gmt8_dt_obj = dt_obj + timedelta(hours=8)
+    hour = int(original_datetime_str[11:13]) + 8
+    if hour >= 24:
+        if day < 28:
+            # Every month has at least 28 days, so this cannot roll over into the next month
+            hour -= 24
+            day += 1
+        else:
+            # Near the end of the month, let datetime handle the roll-over, parsing
+            # with the C ISO parser after dropping the trailing 'Z'
+            gmt8_dt_obj = datetime.fromisoformat(original_datetime_str[:-1]) + _GMT8
+            year, month, day, hour = gmt8_dt_obj.year, gmt8_dt_obj.month, gmt8_dt_obj.day, gmt8_dt_obj.hour
 
-    # Format the datetime object into the desired string format
-    formatted_datetime_str = gmt8_dt_obj.strftime('%d %b %Y @ %H%M HRS')
+    # Format the fields into the desired string format
+    formatted_datetime_str = f"{day:02d} {_MONTHS[month - 1]} {year} @ {hour:02d}{minute:02d} HRS"
 
     return formatted_datetime_str
 
+def format_datetimes(original_datetime_strs: List[str]) -> List[str]:
+    """
+    Format a batch of datetime strings from ISO format to a readable format.
+    Each distinct string is formatted once, so events sharing start and end
+    times cost a single dictionary lookup.
+
+    Args:
+        original_datetime_strs (List[str]): The original datetime strings in ISO format.
+
+    Returns:
+        List[str]: The formatted datetime strings, in the same order.
+    """
+    unique_strs = list(dict.fromkeys(original_datetime_strs))
+    if len(unique_strs) >= _VECTORIZE_MIN_BATCH:
+        formatted = dict(zip(unique_strs, _format_datetimes_vectorized(unique_strs)))
+    else:
+        formatted = {s: format_datetime(s) for s in unique_strs}
+    return [formatted[s] for s in original_datetime_strs]
+
+def _format_datetimes_vectorized(original_datetime_strs: List[str]) -> List[str]:
+    """
+    Format datetime strings from ISO format to a readable format, parsing
+    and converting to GMT +8 with NumPy in one pass over the batch.
+
+    Args:
+        original_datetime_strs (List[str]): The original datetime strings in ISO format.
+
+    Returns:
+        List[str]: The formatted datetime strings, in the same order.
+    """
+    # Imported here so NumPy is only loaded if a batch is large enough to use it
+    import numpy as np
+
+    # Drop the trailing 'Z', as NumPy no longer parses timezone designators
+    gmt8 = np.array([s[:-1] for s in original_datetime_strs], dtype='datetime64[m]') + np.timedelta64(8, 'h')
+
+    # Split into calendar fields relative to the start of each year, month and day
+    month_start = gmt8.astype('datetime64[M]')
+    day_start = gmt8.astype('datetime64[D]')
+    years = gmt8.astype('datetime64[Y]').astype(int) + 1970
+    months = month_start.astype(int) % 12
+    days = (day_start - month_start).astype(int) + 1
+    hours, minutes = np.divmod((gmt8 - day_start).astype(int), 60)
+
+    return [
+        f"{day:02d} {_MONTHS[month]} {year} @ {hour:02d}{minute:02d} HRS"
+        for year, month, day, hour, minute in zip(
+            years.tolist(), months.tolist(), days.tolist(), hours.tolist(), minutes.tolist()
+        )
+    ]
+
+def configure_geocode_cache(path: str, ttl: float, max_entries: int) -> None:
+    """
+    Persist the reverse geocoding cache to a SQLite file, so it survives restarts.
+    Should be called at application start-up, before the first lookup.
+
+    Args:
+        path (str): The SQLite database file.
+        ttl (float): The number of seconds a looked up address stays valid.
+        max_entries (int): The maximum number of addresses kept in memory.
+    """
+    global _GEOCODE_CACHE
+    _GEOCODE_CACHE = PersistentTTLCache(path, 'geocode', maxsize=max_entries, ttl=ttl)
+
+async def coalesce(
+    inflight: Dict[str, 'asyncio.Future[_T]'], key: str, factory: Callable[[], Awaitable[_T]]
+) -> _T:
+    """
+    Run factory() once per key at a time: callers arriving while a run for the
+    same key is in flight wait for and share its result instead of starting another.
+
+    Args:
+        inflight (Dict[str, asyncio.Future[_T]]): The runs in flight, by key. Entries are
+            removed as soon as their run finishes.
+        key (str): The key identifying the run.
+        factory (Callable[[], Awaitable[_T]]): Creates the awaitable to run on a miss.
+
+    Returns:
+        _T: The result of the shared run.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+
+    # Shield the shared run so one cancelled caller does not cancel it for the others
+    return await asyncio.shield(task)
+
+class GeocodingError(Exception):
+    """
+    Raised when the Geocoding API answers with an error status, e.g. an exceeded quota.
+    """
+
+def _geocode_url(latitude: float, longitude: float, api_key: str) -> str:
+    """
+    Build the reverse geocoding request URL for a latitude and longitude pair.
+
+    Args:
+        latitude (float): The latitude.
+        longitude (float): The longitude.
+        api_key (str): The API key for the Google Geocoding API.
+
+    Returns:
+        str: The request URL.
+    """
+    return _GEOCODE_URL.format(lat=f'{latitude:.6f}', lng=f'{longitude:.6f}', key=quote_plus(api_key or ''))
+
+def _parse_geocode_response(content: bytes) -> str:
+    """
+    Extract the formatted address from a reverse geocoding response body.
+
+    Args:
+        content (bytes): The raw JSON response body.
+
+    Returns:
+        str: The formatted address or a not-found message.
+
+    Raises:
+        GeocodingError: If the API answered with an error status.
+    """
+    # orjson parses the raw bytes directly, skipping charset detection and text decoding
+    data = orjson.loads(content)
+    status = data.get('status')
+    if status == 'OK' and data.get('results'):
+        return data['results'][0]['formatted_address']
+    if status in ('OK', 'ZERO_RESULTS'):
+        return 'No address found for the provided coordinates.'
+    raise GeocodingError(f"{status} - {data.get('error_message', '')}")
+
+def _geocode_cached(latitude: float, longitude: float, api_key: str) -> str:
+    """
+    Look up the formatted address for a latitude and longitude pair.
+    Results are cached in memory and on disk; failed requests and
+    error statuses from the API raise and are therefore not cached.
+
+    Args:
+        latitude (float): The latitude.
+        longitude (float): The longitude.
+        api_key (str): The API key for the Google Geocoding API.
+
+    Returns:
+        str: The formatted address or a not-found message.
+    """
+    key = f'{latitude}:{longitude}'
+    address = _GEOCODE_CACHE.get(key)
+    if address is not None:
+        return address
+
+    response = _SESSION.get(_geocode_url(latitude, longitude, api_key), timeout=_GEOCODE_TIMEOUT)
+    response.raise_for_status()
+    address = _parse_geocode_response(response.content)
+
+    _GEOCODE_CACHE.set(key, address)
+    return address
+
+async def _geocode_cached_async(
+    latitude: float, longitude: float, api_key: str, client: httpx.AsyncClient
+) -> str:
+    """
+    Look up the formatted address for a latitude and longitude pair without
+    blocking the event loop. Shares its cache with _geocode_cached, and
+    concurrent lookups of the same coordinates wait for a single request.
+
+    Args:
+        latitude (float): The latitude.
+        longitude (float): The longitude.
+        api_key (str): The API key for the Google Geocoding API.
+        client (httpx.AsyncClient): The client to send the request with.
+
+    Returns:
+        str: The formatted address or a not-found message.
+    """
+    # The cache may hit SQLite, so keep it off the event loop
+    key = f'{latitude}:{longitude}'
+    address = await anyio.to_thread.run_sync(_GEOCODE_CACHE.get, key)
+    if address is not None:
+        return address
+
+    return await coalesce(
+        _GEOCODE_INFLIGHT, key, lambda: _fetch_address_async(key, latitude, longitude, api_key, client)
+    )
+
+async def _fetch_address_async(
+    key: str, latitude: float, longitude: float, api_key: str, client: httpx.AsyncClient
+) -> str:
+    """
+    Request the formatted address for a latitude and longitude pair and cache it.
+
+    Args:
+        key (str): The cache key of the coordinates.
+        latitude (float): The latitude.
+        longitude (float): The longitude.
+        api_key (str): The API key for the Google Geocoding API.
+        client (httpx.AsyncClient): The client to send the request with.
+
+    Returns:
+        str: The formatted address or a not-found message.
+    """
+    url = _geocode_url(latitude, longitude, api_key)
+
+    # Retry rate-limited and transient server errors with exponential backoff,
+    # matching the Retry policy mounted on _SESSION
+    for attempt in range(_GEOCODE_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(_GEOCODE_BACKOFF * 2 ** (attempt - 1))
+        try:
+            response = await client.get(url, timeout=_GEOCODE_ASYNC_TIMEOUT)
+        except httpx.TransportError:
+            if attempt == _GEOCODE_RETRIES:
+                raise
+            continue
+        if response.status_code not in _GEOCODE_RETRY_STATUSES:
+            break
+    response.raise_for_status()
+    address = _parse_geocode_response(response.content)
+
+    await anyio.to_thread.run_sync(_GEOCODE_CACHE.set, key, address)
+    return address
+
 def format_address(coordinates: List[float], api_key: str) -> str:
     """
     Get the formatted address from latitude and longitude coordinates.
+    Coordinates are rounded to 4 decimal places (about 10 m) so that
+    recurring events at the same venue share a cached lookup.
 
     Args:
         coordinates (List[float]): A list containing longitude and latitude.
@@ -34,22 +337,85 @@ def format_address(coordinates: List[float], api_key: str) -> str:
     Returns:
         str: The formatted address or an error message.
     """
-    longitude = coordinates[0]
-    latitude = coordinates[1]
-    url = f'https://maps.googleapis.com/maps/api/geocode/json?latlng={latitude},{longitude}&key={api_key}'
-    response = requests.get(url)
-
-    # Check if the request was successful
-    if response.status_code == 200:
-        data = response.json()
-        if data['results']:
-            formatted_address = data['results'][0]['formatted_address']
-            return formatted_address
-        else:
-            return 'No address found for the provided coordinates.'
-    else:
-        return f'Error: {response.status_code} - {response.text}'
+    longitude = round(coordinates[0], 4)
+    latitude = round(coordinates[1], 4)
+    try:
+        return _geocode_cached(latitude, longitude, api_key)
+    except requests.HTTPError as e:
+        return f'Error: {e.response.status_code} - {e.response.text}'
+    except (requests.RequestException, GeocodingError) as e:
+        return f'Error: {e}'
+
+async def format_address_async(coordinates: List[float], api_key: str, client: httpx.AsyncClient) -> str:
+    """
+    Get the formatted address from latitude and longitude coordinates,
+    for use from async code. Behaves like format_address.
+
+    Args:
+        coordinates (List[float]): A list containing longitude and latitude.
+        api_key (str): The API key for the Google Geocoding API.
+        client (httpx.AsyncClient): The client to send the request with.
+
+    Returns:
+        str: The formatted address or an error message.
+    """
+    longitude = round(coordinates[0], 4)
+    latitude = round(coordinates[1], 4)
+    try:
+        return await _geocode_cached_async(latitude, longitude, api_key, client)
+    except httpx.HTTPStatusError as e:
+        return f'Error: {e.response.status_code} - {e.response.text}'
+    except (httpx.HTTPError, GeocodingError) as e:
+        return f'Error: {e}'
+
+def format_addresses_bulk(coords_list: List[List[float]], api_key: str, workers: int = 8) -> List[str]:
+    """
+    Get the formatted addresses for many coordinates at once. Coordinates are
+    deduplicated after rounding, and the distinct lookups run concurrently.
+
+    Args:
+        coords_list (List[List[float]]): A list of [longitude, latitude] coordinates.
+        api_key (str): The API key for the Google Geocoding API.
+        workers (int): The maximum number of concurrent lookups.
+
+    Returns:
+        List[str]: The formatted address or an error message for each coordinate, in order.
+    """
+    keys = [(round(coordinates[0], 4), round(coordinates[1], 4)) for coordinates in coords_list]
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique_keys))) as executor:
+        addresses = executor.map(lambda key: format_address(list(key), api_key), unique_keys)
+        addresses_by_key = dict(zip(unique_keys, addresses))
+    return [addresses_by_key[key] for key in keys]
+
+async def format_addresses_bulk_async(
+    coords_list: List[List[float]], api_key: str, client: httpx.AsyncClient
+) -> List[str]:
+    """
+    Get the formatted addresses for many coordinates at once, for use from
+    async code. Coordinates are deduplicated after rounding, and the distinct
+    lookups run concurrently on the client.
+
+    Args:
+        coords_list (List[List[float]]): A list of [longitude, latitude] coordinates.
+        api_key (str): The API key for the Google Geocoding API.
+        client (httpx.AsyncClient): The client to send the requests with.
 
+    Returns:
+        List[str]: The formatted address or an error message for each coordinate, in order.
+    """
+    keys = [(round(coordinates[0], 4), round(coordinates[1], 4)) for coordinates in coords_list]
+    unique_keys = list(dict.fromkeys(keys))
+    addresses = await asyncio.gather(
+        *(format_address_async(list(key), api_key, client) for key in unique_keys)
+    )
+    addresses_by_key = dict(zip(unique_keys, addresses))
+    return [addresses_by_key[key] for key in keys]
+
+@lru_cache(maxsize=2048)
 def event_search_URL(event_title: str) -> str:
     """
     Generate a Google search URL for the event title.
@@ -60,42 +426,54 @@ def event_search_URL(event_title: str) -> str:
     Returns:
         str: The Google search URL for the event.
     """
-    modified_event_title = event_title.replace(' ', '+')
-    google_search = f"https://www.google.com/search?q={modified_event_title}"
+    modified_event_title = quote_plus(event_title)
+    google_search = _SEARCH_URL.format(q=modified_event_title)
     return google_search
 
 def format_opening_hours(opening_hours: Dict[str, Any]) -> Dict[str, str]:
     """
-    Format the opening hours from the place details.
+    Format the regular opening hours of a place from the Google Places API (New).
 
     Args:
-        opening_hours (Dict[str, Any]): The opening hours data from place details.
+        opening_hours (Dict[str, Any]): The regularOpeningHours data of the place.
 
     Returns:
-        Dict[str, str]: A dictionary mapping days to opening hours.
+        Dict[str, str]: A dictionary mapping days to opening hours, e.g. {'Mon': '0800-2100'}.
     """
-    try:
-        periods = opening_hours.get('periods', [])
-        week_hours = {}
-        days_map = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
-        for day in range(7):
-            day_name = days_map[day]
-            for period in periods:
-                if period['open']['day'] == day:
-                    open_time = period['open']['time']
-                    close_time = period['close']['time']
-                    week_hours[day_name] = f"{open_time}-{close_time}"
-        return week_hours
-    except:
+    if not opening_hours:
         return {}
 
+    # Collect the hours by day number in one pass over the periods. Days with
+    # split hours keep their first period, and the pass stops once every day is filled
+    hours_by_day = {}
+    for period in opening_hours.get('periods') or ():
+        open_period = period.get('open')
+        close_period = period.get('close')
+        if open_period is None or close_period is None:
+            # Venues open 24 hours have a single period with no closing time
+            continue
+        # Zero values (Sunday, midnight, on the hour) are omitted from the response
+        day = open_period.get('day', 0)
+        if day in hours_by_day:
+            continue
+        hours_by_day[day] = (
+            f"{open_period.get('hour', 0):02d}{open_period.get('minute', 0):02d}-"
+            f"{close_period.get('hour', 0):02d}{close_period.get('minute', 0):02d}"
+        )
+        if len(hours_by_day) == 7:
+            break
+
+    # Order the days from Sunday to Saturday, regardless of the order of the periods
+    return {day_name: hours_by_day[day] for day, day_name in enumerate(_DAYS) if day in hours_by_day}
+
 def format_contact_number(number: str) -> str:
     """
     Formats a Singaporean contact number to the format +65-XXXX-XXXX.
     Handles NoneType inputs gracefully.
 
     Args:
-        number (str): The input contact number in the format 'XXXX XXXX', or None.
+        number (str): The input contact number in the format 'XXXX XXXX' or
+            '+65-XXXX-XXXX', or None.
 
     Returns:
         str: The formatted contact number in the format '+65-XXXX-XXXX',
@@ -108,13 +486,16 @@ def format_contact_number(number: str) -> str:
     if not isinstance(number, str):
         return "None"
 
-    # Remove any whitespace from the input
-    cleaned_number = number.replace(" ", "")
-    
-    # Check if the cleaned number has exactly 8 digits and is numeric
-    if len(cleaned_number) != 8 or not cleaned_number.isdigit():
+    # Numbers that are already formatted, e.g. re-rendered from cached results, are returned as is
+    if (len(number) == 13 and number.startswith('+65-') and number[8] == '-'
+            and number[4:8].isdigit() and number[9:].isdigit()):
+        return number
+
+    # Check that the number is two groups of 4 digits, optionally separated by whitespace
+    match = _PHONE_PATTERN.match(number)
+    if match is None:
         return "None"
 
     # Format the number with the Singapore country code
-    formatted_number = f"+65-{cleaned_number[:4]}-{cleaned_number[4:]}"
+    formatted_number = f"+65-{match[1]}-{match[2]}"
     return formatted_number
\ No newline at end of file